@@ -1,16 +1,17 @@
-
 # Entrypoint for GitHub Actions: run lotto analysis and write alerts
-import sys
-import os
+from pathlib import Path
+import orjson
 from lotto_logic import run_lotto_analysis
 
+ALERTS_FILE = Path("public/alerts.json")
+
 def main():
     alerts = run_lotto_analysis()
-    os.makedirs("public", exist_ok=True)
-    with open("public/alerts.json", "w") as f:
-        for line in alerts:
-            f.write(line + "\n")
-    print(f"Wrote {len(alerts)} alerts to public/alerts.json")
+    output = {"alerts": alerts}
+    ALERTS_FILE.parent.mkdir(exist_ok=True)
+    # Compact UTF-8 bytes: the file is served to Firebase, not read by hand
+    ALERTS_FILE.write_bytes(orjson.dumps(output))
+    print(f"Wrote {len(alerts)} alerts to {ALERTS_FILE}")
 
 if __name__ == "__main__":
     main()
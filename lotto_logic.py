@@ -1,12 +1,19 @@
-import os, json, requests, time
+import os, re, json, hashlib, functools, requests
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from datetime import datetime, timedelta
 from pathlib import Path
 from itertools import combinations
-from bs4 import BeautifulSoup
+from operator import attrgetter
+from typing import NamedTuple
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ---------------- Config ----------------
 start_year = 2013
-zend_year = datetime.today().year
+end_year = datetime.today().year
 replacement_values = {0: 5, 1: 9, 2: 8, 3: 7, 4: 6, 5: 0, 6: 4, 7: 3, 8: 2, 9: 1}
 
 state_games = {
@@ -15,7 +22,15 @@ state_games = {
 }
 
 BASE_URL = "https://www.lottery.net"
+# Keep concurrent requests to lottery.net small to avoid anti-bot throttling
+FETCH_WORKERS = 8
 IL_DATA_FILE = Path("illinois_draws.json")
+IL_LOG_FILE = Path("illinois_draws.jsonl")
+IL_TRIED_FILE = Path("illinois_tried.json")
+IL_SCHEMA = 1
+# Fold the JSONL log into illinois_draws.json once it holds this many draws
+IL_COMPACT_EVERY = 500
+HTTP_CACHE_DIR = Path(".lottery_cache")
 
 HEADERS = {
     "User-Agent": (
@@ -28,27 +43,102 @@ HEADERS = {
 }
 
 
-def safe_get(url: str, max_retries: int = 3, timeout: int = 10):
-    """Make requests.get with retries and basic debug logging.
-    Returns the `requests.Response` on status 200, or None on repeated failure.
+# One pooled session for every lottery.net request so Keep-Alive connections
+# are reused; transient gateway errors are retried with backoff by urllib3.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    ),
+))
+
+
+def safe_get(url: str, timeout: int = 10, headers: dict | None = None):
+    """Make a GET through the shared session with basic debug logging.
+    Retries are handled by the session adapter. Returns the `requests.Response`
+    (callers check the status), or None if the request could not be made.
+    """
+    try:
+        resp = SESSION.get(url, headers={**HEADERS, **(headers or {})}, timeout=timeout)
+    except requests.RequestException as e:
+        print(f"Request error fetching {url}:", e)
+        return None
+    if resp.status_code not in (200, 304):
+        # non-200: log a short preview
+        print(f"HTTP {resp.status_code} fetching {url}")
+        preview = (resp.text or "")[:300]
+        if preview:
+            print("Preview:", preview)
+    return resp
+
+def cached_get(url: str, validate, frozen: bool = False, timeout: int = 10) -> bytes | None:
+    """GET a page through the on-disk cache in `HTTP_CACHE_DIR`.
+    Cached pages are revalidated with If-None-Match / If-Modified-Since and the
+    stored body is reused on 304. A downloaded body is stored only if
+    `validate(body)` is true; otherwise it counts as a failed fetch. Pages
+    stored with `frozen=True` (settled past years) are served from disk
+    without a request.
+    Returns the page bytes, or None if it could not be fetched.
     """
-    last_resp = None
-    for attempt in range(1, max_retries + 1):
+    key = hashlib.sha1(url.encode()).hexdigest()
+    body_path = HTTP_CACHE_DIR / f"{key}.html"
+    meta_path = HTTP_CACHE_DIR / f"{key}.json"
+
+    meta = {}
+    if body_path.exists() and meta_path.exists():
         try:
-            resp = requests.get(url, headers=HEADERS, timeout=timeout)
-            last_resp = resp
-            if resp.status_code == 200:
-                return resp
-            # non-200: log a short preview and retry if allowed
-            print(f"HTTP {resp.status_code} fetching {url} (attempt {attempt}/{max_retries})")
-            preview = (resp.text or "")[:300]
-            if preview:
-                print("Preview:", preview)
-        except requests.RequestException as e:
-            print(f"Request error fetching {url} (attempt {attempt}/{max_retries}):", e)
-        if attempt < max_retries:
-            time.sleep(3)
-    return last_resp
+            meta = json.loads(meta_path.read_text())
+        except ValueError:
+            meta = {}
+        if not meta.get("valid"):
+            # written before bodies were validated; don't trust it
+            meta = {}
+        elif meta.get("frozen"):
+            return body_path.read_bytes()
+
+    conditional = {}
+    if meta.get("etag"):
+        conditional["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        conditional["If-Modified-Since"] = meta["last_modified"]
+
+    resp = safe_get(url, timeout=timeout, headers=conditional)
+    if resp is None:
+        return None
+    if resp.status_code == 304 and meta:
+        body = body_path.read_bytes()
+    elif resp.status_code == 200:
+        body = resp.content
+        if not validate(body):
+            print(f"Unusable page body from {url}; not caching it")
+            return None
+        HTTP_CACHE_DIR.mkdir(exist_ok=True)
+        body_path.write_bytes(body)
+    else:
+        return None
+
+    meta = {
+        "etag": resp.headers.get("ETag", meta.get("etag")),
+        "last_modified": resp.headers.get("Last-Modified", meta.get("last_modified")),
+        "frozen": frozen,
+        "valid": True,
+    }
+    meta_path.write_text(json.dumps(meta))
+    return body
+
+# ---------------- Draw Records ----------------
+class Draw(NamedTuple):
+    dt: datetime
+    date_str: str
+    slot: str
+    numbers: tuple[int, ...]
+
+by_dt = attrgetter("dt")
 
 # ---------------- Alerts ----------------
 alerts = []
@@ -71,66 +161,165 @@ def display_alerts(play_date, game_name, candidate, result=None, action="play"):
 def toggle_state(state: str) -> str:
     return "off" if state == "on" else "on"
 
+_MONTHS = {
+    m: i for i, m in enumerate(
+        ["January", "February", "March", "April", "May", "June", "July",
+         "August", "September", "October", "November", "December"],
+        1,
+    )
+}
+
 def parse_base_date(month: str, day: str, year: str) -> tuple[str, datetime]:
+    # Direct construction; strptime re-walks the format string on every row.
+    # Like strptime's %B, month names match case-insensitively.
+    month_num = _MONTHS.get(month.capitalize())
+    if month_num is None:
+        raise ValueError(f"unknown month name: {month!r}")
     base_str = f"{month} {day}, {year}"
-    dt = datetime.strptime(base_str, "%B %d, %Y")
+    dt = datetime(int(year), month_num, int(day))
     return base_str, dt
 
 # ---------------- Illinois JSON Helpers ----------------
-def clean_il_data(data: dict) -> dict:
-    cleaned = {}
-    for game, dates in (data or {}).items():
-        pick = 3 if "3" in game else 4
-        cleaned[game] = {}
+def _make_il_cleaner(pick: int):
+    """Build a per-game cleaner with `pick` bound, so the hot loop doesn't
+    re-derive it. Well-formed draws are kept as-is; others are filtered."""
+    def clean(dates: dict) -> dict:
+        cleaned = {}
         for date, draws in (dates or {}).items():
-            valid_draws = {}
             if not isinstance(draws, dict):
                 continue
+            valid_draws = {}
             for draw_type, numbers in draws.items():
-                if isinstance(numbers, list):
-                    nums = [n for n in numbers if isinstance(n, int)]
-                    if len(nums) == pick:
-                        valid_draws[draw_type] = nums
+                if type(numbers) is not list:
+                    continue
+                if len(numbers) == pick and all(type(n) is int for n in numbers):
+                    valid_draws[draw_type] = numbers
+                    continue
+                nums = [n for n in numbers if isinstance(n, int)]
+                if len(nums) == pick:
+                    valid_draws[draw_type] = nums
             if valid_draws:
-                cleaned[game][date] = valid_draws
-        cleaned[game] = dict(sorted(cleaned[game].items()))
+                cleaned[date] = valid_draws
+        return cleaned
+    return clean
+
+_IL_CLEANERS = {"pick3": _make_il_cleaner(3), "pick4": _make_il_cleaner(4)}
+
+def clean_il_data(data: dict) -> dict:
+    cleaned = {}
+    for game, dates in (data or {}).items():
+        cleaner = _IL_CLEANERS.get(game) or _make_il_cleaner(3 if "3" in game else 4)
+        cleaned[game] = cleaner(dates)
     return cleaned
 
 def load_il_data() -> dict:
-    if os.path.exists(IL_DATA_FILE):
-        with open(IL_DATA_FILE, "r") as f:
-            try:
-                data = json.load(f)
-            except:
-                data = {}
+    """Load the Illinois JSON and replay the draws appended to the JSONL log.
+    Files written by `save_il_data` carry a `_schema` marker and skip cleaning;
+    a file without it is cleaned and compacted once so later loads can skip it.
+    Log records were validated when fetched, so they are replayed as-is.
+    """
+    if IL_DATA_FILE.exists():
+        try:
+            data = orjson.loads(IL_DATA_FILE.read_bytes())
+        except orjson.JSONDecodeError:
+            data = {}
     else:
         data = {}
-    return clean_il_data(data)
+    is_clean = isinstance(data, dict) and data.pop("_schema", None) == IL_SCHEMA
+
+    if not is_clean:
+        data = clean_il_data(data)
+
+    if IL_LOG_FILE.exists():
+        with IL_LOG_FILE.open("rb") as f:
+            for line in f:
+                try:
+                    rec = orjson.loads(line)
+                    data.setdefault(f"pick{rec['p']}", {}).setdefault(rec["d"], {})[rec["s"]] = rec["n"]
+                except (orjson.JSONDecodeError, KeyError, TypeError):
+                    # a torn last line from an interrupted run; ignore it
+                    continue
+
+    if not is_clean:
+        save_il_data(data)
+    return data
 
 def save_il_data(data: dict):
+    """Compact: clean and write the full Illinois JSON, then drop the JSONL log."""
+    # OPT_SORT_KEYS keeps dates ordered on disk, so clean_il_data needn't sort
     cleaned = clean_il_data(data)
-    with open(IL_DATA_FILE, "w") as f:
-        json.dump(cleaned, f, indent=2)
+    IL_DATA_FILE.write_bytes(orjson.dumps(
+        {"_schema": IL_SCHEMA, **cleaned},
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS,
+    ))
+    if os.path.exists(IL_LOG_FILE):
+        os.remove(IL_LOG_FILE)
+
+def append_il_draw(date: str, pick: int, draw_type: str, numbers: list[int]):
+    """Record one fetched draw in the append-only JSONL log.
+    Keeps a backfill crash-safe without rewriting the whole JSON per fetch.
+    """
+    with IL_LOG_FILE.open("ab") as f:
+        f.write(orjson.dumps({"d": date, "p": pick, "s": draw_type, "n": numbers}) + b"\n")
+
+def il_log_length() -> int:
+    if not IL_LOG_FILE.exists():
+        return 0
+    with IL_LOG_FILE.open("rb") as f:
+        return sum(1 for _ in f)
 
 # ---------------- Illinois Fetching ----------------
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# Compiled once: equivalent of `ul.illinois.results.pick-P-T li.ball`
+_IL_XPATHS = {
+    (pick, draw_type): etree.XPath(
+        f"//ul[{_has_class('illinois')} and {_has_class('results')}"
+        f" and {_has_class(f'pick-{pick}-{draw_type}')}]//li[{_has_class('ball')}]"
+    )
+    for pick in (3, 4)
+    for draw_type in ("midday", "evening")
+}
+
 def fetch_il_draw(date: str, draw_type: str, pick: int):
+    """Return the drawn numbers, [] if the site has no such draw (404), or None
+    if the page could not be fetched or had no full result. A 200 page without
+    balls is usually an anti-bot page or a layout change, so it is retried.
+    """
     url = f"{BASE_URL}/illinois/pick-{pick}-{draw_type}/numbers/{date}"
-    res = safe_get(url, max_retries=3, timeout=10)
+    res = safe_get(url, timeout=10)
     if res is None:
         return None
     if res.status_code == 404:
-        return None
+        return []
     if res.status_code != 200:
         return None
 
-    soup = BeautifulSoup(res.text, "html.parser")
-    balls = soup.select(f"ul.illinois.results.pick-{pick}-{draw_type} li.ball")
-    numbers = [int(n.text.strip()) for n in balls if n.text.strip().isdigit()]
+    try:
+        tree = html.fromstring(res.content)
+    except etree.ParserError:
+        # empty body: transient, retry on a later run rather than record a gap
+        return None
+    texts = (li.text_content().strip() for li in _IL_XPATHS[(pick, draw_type)](tree))
+    numbers = [int(t) for t in texts if t.isdigit()]
 
     if len(numbers) == pick:
         return numbers
     return None
 
+def load_il_tried() -> set[str]:
+    """Keys ("MM-DD-YYYY/pick/slot") of past draws the site 404'd for."""
+    if not IL_TRIED_FILE.exists():
+        return set()
+    try:
+        return set(orjson.loads(IL_TRIED_FILE.read_bytes()))
+    except (orjson.JSONDecodeError, TypeError):
+        return set()
+
+def save_il_tried(tried: set[str]):
+    IL_TRIED_FILE.write_bytes(orjson.dumps(sorted(tried)))
+
 def update_il_data_to_current():
     """
     Update Illinois JSON for the recent date range.
@@ -150,28 +339,44 @@ def update_il_data_to_current():
         # Nothing to backfill; return existing data
         return data
 
-    start_date = today - timedelta(days=backfill_days)
-    date = start_date
-
-    while date <= today:
-        date_str = date.strftime("%m-%d-%Y")
-        for pick in (3, 4):
-            game_key = f"pick{pick}"
-            data.setdefault(game_key, {})
-            data[game_key].setdefault(date_str, {})
-
-            for draw_type in ("midday", "evening"):
-                if draw_type not in data[game_key][date_str]:
-                    numbers = fetch_il_draw(date_str, draw_type, pick)
-                    if numbers:
-                        data[game_key][date_str][draw_type] = numbers
-                        save_il_data(data)
-        date += timedelta(days=1)
-
-    save_il_data(data)
+    date_range = [today - timedelta(days=n) for n in range(backfill_days, -1, -1)]
+    tried = load_il_tried()
+    missing = [
+        (date_str, pick, draw_type)
+        for date_str in (d.strftime("%m-%d-%Y") for d in date_range)
+        for pick in (3, 4)
+        for draw_type in ("midday", "evening")
+        if draw_type not in data.get(f"pick{pick}", {}).get(date_str, {})
+        and f"{date_str}/{pick}/{draw_type}" not in tried
+    ]
+    if not missing:
+        return data
+
+    # Dates before yesterday should have results posted; if the site 404s,
+    # remember that so the gap isn't re-probed on every run.
+    cutoff = today.date() - timedelta(days=1)
+    settled_dates = {d.strftime("%m-%d-%Y") for d in date_range if d.date() < cutoff}
+
+    # Fetch the day pages concurrently over the pooled session; results come
+    # back in job order and are logged from this thread as they arrive.
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        results = ex.map(lambda job: fetch_il_draw(job[0], job[2], job[1]), missing)
+        for (date_str, pick, draw_type), numbers in zip(missing, results):
+            if numbers:
+                data.setdefault(f"pick{pick}", {}).setdefault(date_str, {})[draw_type] = numbers
+                append_il_draw(date_str, pick, draw_type, numbers)
+            elif numbers == [] and date_str in settled_dates:
+                tried.add(f"{date_str}/{pick}/{draw_type}")
+
+    # Markers outside the backfill window can never be probed again; drop them
+    window = {d.strftime("%m-%d-%Y") for d in date_range}
+    save_il_tried({key for key in tried if key.split("/", 1)[0] in window})
+
+    if il_log_length() >= IL_COMPACT_EVERY:
+        save_il_data(data)
     return data
 
-def fetch_draws_il(draw_type="evening", pick=3):
+def fetch_draws_il(draw_type="evening", pick=3) -> list[Draw]:
     data = update_il_data_to_current()
     draws = []
     game_key = f"pick{pick}"
@@ -179,7 +384,7 @@ def fetch_draws_il(draw_type="evening", pick=3):
     if game_key not in data:
         return []
 
-    for date_str, draws_dict in sorted(data[game_key].items()):
+    for date_str, draws_dict in data[game_key].items():
         if draw_type not in draws_dict:
             continue
         dt = datetime.strptime(date_str, "%m-%d-%Y")
@@ -188,65 +393,152 @@ def fetch_draws_il(draw_type="evening", pick=3):
         if len(numbers) != pick:
             continue
 
-        draws.append({
-            "dt": dt,
-            "date_str": f"{dt.strftime('%B %d, %Y')} ({draw_type})",
-            "slot": draw_type,
-            "numbers": numbers
-        })
+        draws.append(Draw(
+            dt,
+            f"{dt.strftime('%B %d, %Y')} ({draw_type})",
+            draw_type,
+            tuple(numbers),
+        ))
+    # "%m-%d-%Y" keys don't sort chronologically across years; order by dt
+    draws.sort(key=by_dt)
     return draws
 
+# ---------------- Draw Cache ----------------
+def _rows_path(url: str) -> Path:
+    return HTTP_CACHE_DIR / f"{hashlib.sha1(url.encode()).hexdigest()}.rows.json"
+
+def load_cached_rows(url: str, page: bytes) -> list[Draw] | None:
+    """Return the draws memoized by `save_cached_rows` for `url` if they were
+    parsed from this exact page body, otherwise None.
+    """
+    path = _rows_path(url)
+    if not path.exists():
+        return None
+    try:
+        entry = orjson.loads(path.read_bytes())
+        if entry["sha1"] != hashlib.sha1(page).hexdigest():
+            return None
+        return [
+            Draw(datetime.fromisoformat(dt), date_str, slot, tuple(numbers))
+            for dt, date_str, slot, numbers in entry["draws"]
+        ]
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+def save_cached_rows(url: str, page: bytes, draws: list[Draw]):
+    entry = {
+        "sha1": hashlib.sha1(page).hexdigest(),
+        "draws": [[d.dt.isoformat(), d.date_str, d.slot, d.numbers] for d in draws],
+    }
+    HTTP_CACHE_DIR.mkdir(exist_ok=True)
+    _rows_path(url).write_bytes(orjson.dumps(entry))
+
 # ---------------- Generic Fetch ----------------
-def fetch_draws(state: str, draw_type: str, pick: int = 3) -> list[dict]:
-    if state == "Chicago":
-        return fetch_draws_il(draw_type, pick)
+# Whitespace-delimited all-digit tokens, same as `x.isdigit()` over `split()`
+_DIGIT_RE = re.compile(r"(?<!\S)\d+(?!\S)")
+
+def _release(elem):
+    """Drop a streamed element and its already-processed siblings."""
+    elem.clear()
+    while elem.getprevious() is not None:
+        del elem.getparent()[0]
+
+def _parse_year_page(page: bytes, draw_type: str, pick: int) -> list[Draw]:
+    """Return a Draw for each result row of a year page.
+    Raises `etree.XMLSyntaxError` if the body can't be parsed (e.g. empty).
+    """
+    found = []
+    # Stream rows from the raw bytes (lxml sniffs the encoding) and free
+    # each one once read, rather than holding the whole page's DOM.
+    for _, row in etree.iterparse(BytesIO(page), events=("end",), tag="tr", html=True):
+        tds = row.findall("td")
+        if len(tds) < 2:
+            _release(row)
+            continue
 
-    out = []
-    state_url = state_games[state]
+        parts = "".join(tds[0].itertext()).strip().split()
+        raw = " ".join(tds[1].itertext()).strip()
+        _release(row)
+        if len(parts) < 4:
+            continue
 
-    for yr in range(start_year, end_year + 1):
-        url = f"{BASE_URL}/{state_url}/pick-{pick}-{draw_type}/numbers/{yr}"
-        resp = safe_get(url, max_retries=3, timeout=10)
-        if resp is None or resp.status_code != 200:
-            # skip years we can't fetch (403, timeout, etc.)
+        month, day, year = parts[1], parts[2].rstrip(","), parts[3]
+        try:
+            base_date_str, dt = parse_base_date(month, day, year)
+        except ValueError:
+            # not a "Weekday Month D, YYYY" cell, so not a result row
             continue
 
-        soup = BeautifulSoup(resp.text, "html.parser")
-        rows = soup.find_all("tr")
+        digits = _DIGIT_RE.findall(raw)
+        if len(digits) < pick:
+            continue
 
-        for row in rows:
-            tds = row.find_all("td")
-            if len(tds) < 2:
-                continue
+        numbers = tuple(map(int, digits[:pick]))
+        found.append(Draw(dt, f"{base_date_str} ({draw_type})", draw_type, numbers))
+    return found
 
-            parts = tds[0].text.strip().split()
-            if len(parts) < 4:
-                continue
+def _year_draws(url: str, page: bytes, draw_type: str, pick: int) -> list[Draw]:
+    """Draws on one year page, parsed only if the body changed since last time.
+    An unparseable body yields no draws and is not memoized.
+    """
+    draws = load_cached_rows(url, page)
+    if draws is None:
+        try:
+            draws = _parse_year_page(page, draw_type, pick)
+        except etree.XMLSyntaxError:
+            return []
+        if draws:
+            save_cached_rows(url, page, draws)
+    return draws
 
-            month, day, year = parts[1], parts[2].rstrip(","), parts[3]
-            base_date_str, dt = parse_base_date(month, day, year)
+def fetch_draws(state: str, draw_type: str, pick: int = 3) -> list[Draw]:
+    if state == "Chicago":
+        return fetch_draws_il(draw_type, pick)
 
-            raw = tds[1].get_text(separator=" ").strip()
-            digits = [int(x) for x in raw.split() if x.isdigit()]
-            if len(digits) < pick:
-                continue
+    state_url = state_games[state]
+    out = []
 
-            numbers = digits[:pick]
-            out.append({
-                "dt": dt,
-                "date_str": f"{base_date_str} ({draw_type})",
-                "slot": draw_type,
-                "numbers": numbers
-            })
+    urls = [
+        (yr, f"{BASE_URL}/{state_url}/pick-{pick}-{draw_type}/numbers/{yr}")
+        for yr in range(start_year, end_year + 1)
+    ]
+    def fetch_year(yr: int, url: str) -> bytes | None:
+        # Validating a fresh body parses it through the per-page memo, so the
+        # loop below reuses those draws instead of parsing the page again.
+        return cached_get(
+            url,
+            lambda body: bool(_year_draws(url, body, draw_type, pick)),
+            frozen=yr < freeze_before,
+            timeout=10,
+        )
+
+    # Year pages are independent; overlap the blocking GETs, then parse in order.
+    # Past years are final, so they are pinned in the cache once fetched, but
+    # only after a grace period: the first run of a new year (UTC) can still
+    # predate the last Dec 31 draw being posted.
+    freeze_before = (datetime.today() - timedelta(days=2)).year
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        pages = list(ex.map(lambda yu: fetch_year(*yu), urls))
+
+    # Pages are memoized individually, so a changed current-year page doesn't
+    # force the unchanged past years to be parsed again.
+    for (_, url), page in zip(urls, pages):
+        if page is None:
+            # skip years we can't fetch (403, timeout, etc.)
+            continue
+        out.extend(_year_draws(url, page, draw_type, pick))
 
-    out.sort(key=lambda r: r["dt"])
+    out.sort(key=by_dt)
     return out
 
 # ---------------- Analysis ----------------
-def run_lotto_analysis():
+@functools.cache
+def run_lotto_analysis() -> tuple[str, ...]:
     """
     Main function called by GitHub Actions → generate_alerts.py → Firebase.
-    Must return a simple list of strings.
+    Returns the alert strings as a tuple. Cached, so a repeated call in the
+    same process doesn't redo every fetch; the tuple keeps callers from
+    mutating the cached result.
     """
     global alerts
     alerts = []
@@ -256,16 +548,14 @@ def run_lotto_analysis():
 
         midday_draws = fetch_draws(state, "midday", pick=3)
         evening_draws = fetch_draws(state, "evening", pick=3)
-        merged_history = sorted(midday_draws + evening_draws, key=lambda r: r["dt"])
 
-        pick4_mid = fetch_draws(state, "midday", pick=4)
-        pick4_eve = fetch_draws(state, "evening", pick=4)
-        pick4_history = sorted(pick4_mid + pick4_eve, key=lambda r: r["dt"])
+        # Both lists come back sorted by dt, so the latest draw is one of the
+        # two tails; evening goes first so it wins a same-day tie.
+        latest = max(evening_draws[-1:] + midday_draws[-1:], key=by_dt, default=None)
 
         # Simple placeholder analysis
-        if merged_history:
-            latest = merged_history[-1]
-            candidate = latest["numbers"][-1]
-            display_alerts(latest["date_str"], state, candidate, action="play")
+        if latest:
+            candidate = latest.numbers[-1]
+            display_alerts(latest.date_str, state, candidate, action="play")
 
-    return alerts
+    return tuple(alerts)